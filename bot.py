@@ -1,16 +1,21 @@
 import discord
 from discord.ext import commands, tasks
-import requests
 import re
 import json
 import asyncio
 import datetime
+import heapq
 import aiohttp
 import os
-from typing import Dict, List
+from typing import Dict
 import logging
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson  # C-accelerated JSON, optional
+except ImportError:
+    orjson = None
+
 # Setup logging with rotation
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +32,9 @@ if not BOT_TOKEN:
     logging.critical("DISCORD_BOT_TOKEN environment variable not set!")
     exit(1)
 
+# Valid Clash Royale player tag characters
+_TAG_RE = re.compile(r'^[0289PYLQGRJCUV]{3,}$')
+
 ADMIN_ROLE_ID = 1398784596509855862
 PLAYER_ROLE_ID = 1427774080605753424
 POINT_TRACKER_CHANNEL_ID = 1427778616435015934
@@ -34,13 +42,14 @@ LEADERBOARD_CHANNEL_ID = 1427778686832349338
 ORDERS_CHANNEL_ID = 1427778727676350576
 
 # Production intervals (seconds)
-POINTS_UPDATE_INTERVAL = 3600  # 1 hour
-LEADERBOARD_UPDATE_INTERVAL = 3600  # 1 hour
+POINTS_UPDATE_INTERVAL = 3600  # 1 hour, also drives the leaderboard refresh
 DAILY_ORDERS_INTERVAL = 86400  # 24 hours
 
 # Database to store player data
 player_data = {}  # Format: {player_tag: {"discord_id": id, "points": int, "name": str}}
-user_accounts = {}  # Format: {discord_id: [player_tag1, player_tag2, ...]}
+user_accounts = {}  # Format: {discord_id: {player_tag1, player_tag2, ...}}
+user_totals = {}  # Format: {discord_id: total_points}, kept in sync with player_data
+bot_state = {}  # Persisted bot bookkeeping, e.g. {"leaderboard_message_id": id}
 
 intents = discord.Intents.default()
 intents.messages = True
@@ -48,79 +57,188 @@ intents.guilds = True
 intents.members = True
 intents.message_content = True
 
-bot = commands.Bot(command_prefix='/', intents=intents)
+class CRLBot(commands.Bot):
+    async def close(self):
+        # Close the scrape session on the bot's own loop before it shuts down
+        await RoyaleAPIScraper.close_session()
+        await super().close()
+
+bot = CRLBot(command_prefix='/', intents=intents)
 
 class RoyaleAPIScraper:
-    last_scrape_time = 0
     SCRAPE_COOLDOWN = 30  # seconds between scrapes
-    
+    _last_scrape = 0.0
+    _scrape_lock = asyncio.Lock()  # serializes cooldown checks across concurrent calls
+    _etag = None  # conditional-GET validators from the last 200 response
+    _last_modified = None
+    _cached_players = []  # last parsed player array, re-matched on 304
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    session = None  # shared aiohttp.ClientSession, created in on_ready
+
+    @staticmethod
+    def get_session():
+        """Get the shared HTTP session, creating it if needed"""
+        if RoyaleAPIScraper.session is None or RoyaleAPIScraper.session.closed:
+            RoyaleAPIScraper.session = aiohttp.ClientSession(
+                headers={'User-Agent': RoyaleAPIScraper.USER_AGENT},
+                connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=75)
+            )
+        return RoyaleAPIScraper.session
+
+    @staticmethod
+    async def close_session():
+        """Close the shared HTTP session on shutdown"""
+        if RoyaleAPIScraper.session is not None and not RoyaleAPIScraper.session.closed:
+            await RoyaleAPIScraper.session.close()
+            RoyaleAPIScraper.session = None
+
     @staticmethod
     async def get_linked_players_placements():
         """
         Scrape RoyaleAPI leaderboard using JSON extraction and find placements of linked players in top 8
         Returns list of linked players found in top 8 with their ranks (1-8)
         """
-        # Rate limiting
-        current_time = asyncio.get_event_loop().time()
-        if current_time - RoyaleAPIScraper.last_scrape_time < RoyaleAPIScraper.SCRAPE_COOLDOWN:
-            await asyncio.sleep(RoyaleAPIScraper.SCRAPE_COOLDOWN)
-        
-        RoyaleAPIScraper.last_scrape_time = current_time
-        
+        # Rate limiting: sleep only for the remaining cooldown, and update the
+        # timestamp inside the lock so concurrent calls can't both slip through
+        async with RoyaleAPIScraper._scrape_lock:
+            now = asyncio.get_event_loop().time()
+            wait = RoyaleAPIScraper.SCRAPE_COOLDOWN - (now - RoyaleAPIScraper._last_scrape)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            RoyaleAPIScraper._last_scrape = asyncio.get_event_loop().time()
+
         try:
             url = "https://royaleapi.com/players/leaderboard?lang=en"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=15) as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
-                    
-                    # Parse the JSON data from the page
-                    players = await RoyaleAPIScraper.extract_player_data_from_json(html_content)
-                    
-                    if players:
-                        logging.info(f"Successfully extracted {len(players)} players from RoyaleAPI")
-                        linked_players = await RoyaleAPIScraper.find_linked_players_in_top_8(players)
-                        return linked_players
-                    else:
-                        logging.error("No player data found in RoyaleAPI")
-                        return []
+            session = RoyaleAPIScraper.get_session()
+
+            headers = {}
+            if RoyaleAPIScraper._etag:
+                headers['If-None-Match'] = RoyaleAPIScraper._etag
+            if RoyaleAPIScraper._last_modified:
+                headers['If-Modified-Since'] = RoyaleAPIScraper._last_modified
+
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 304:
+                    # Leaderboard unchanged upstream, skip download and parse.
+                    # Re-match against player_data so links and unlinks made
+                    # since the last scrape are reflected.
+                    logging.info("RoyaleAPI leaderboard not modified, reusing cached player data")
+                    return await RoyaleAPIScraper.find_linked_players_in_top_8(RoyaleAPIScraper._cached_players)
+
+                response.raise_for_status()
+                RoyaleAPIScraper._etag = response.headers.get('ETag')
+                RoyaleAPIScraper._last_modified = response.headers.get('Last-Modified')
+                html_content = await response.text()
+
+                # Parse the JSON data from the page off the event loop
+                players = await asyncio.to_thread(RoyaleAPIScraper._parse_players_sync, html_content)
+
+                if players:
+                    logging.info(f"Successfully extracted {len(players)} players from RoyaleAPI")
+                    RoyaleAPIScraper._cached_players = players
+                    return await RoyaleAPIScraper.find_linked_players_in_top_8(players)
+                else:
+                    logging.error("No player data found in RoyaleAPI")
+                    return []
                         
         except Exception as e:
             logging.error(f"Error scraping RoyaleAPI: {e}")
             return []
     
     @staticmethod
-    async def extract_player_data_from_json(html_content: str):
+    def _find_player_array(html_content: str, search_pos: int = 0):
         """
-        Extract player data from JSON embedded in the page
+        Find a balanced JSON array containing a "tag" key in the page.
+
+        Scans for the literal "tag" substring, walks back to the enclosing
+        '[' and forward counting bracket depth (respecting quoted strings
+        and backslash escapes) to slice out the array in a single pass,
+        without regex backtracking. Returns (json_str, end_pos) so callers
+        can resume scanning past a bad candidate, or (None, -1) if no
+        further candidate exists.
         """
-        pattern = r'(\[\s*{.*?"tag".*?}\s*(?:,\s*{.*?"tag".*?}\s*)*\])'
-        matches = re.findall(pattern, html_content, re.DOTALL)
-        
-        if not matches:
-            logging.error("Could not find any embedded player data.")
-            return []
+        length = len(html_content)
+
+        while True:
+            tag_pos = html_content.find('"tag"', search_pos)
+            if tag_pos == -1:
+                return None, -1
+
+            # Try candidate '[' positions before the tag, nearest first
+            limit = tag_pos
+            while True:
+                array_start = html_content.rfind('[', 0, limit)
+                if array_start == -1:
+                    break
+                limit = array_start
+
+                # The player array is an array of objects
+                after = array_start + 1
+                while after < length and html_content[after] in ' \t\r\n':
+                    after += 1
+                if after >= length or html_content[after] != '{':
+                    continue
+
+                depth = 0
+                in_string = False
+                escaped = False
+                for i in range(array_start, length):
+                    ch = html_content[i]
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == '\\':
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"':
+                        in_string = True
+                    elif ch == '[' or ch == '{':
+                        depth += 1
+                    elif ch == ']' or ch == '}':
+                        depth -= 1
+                        if depth == 0:
+                            if i > tag_pos:
+                                return html_content[array_start:i + 1], i + 1
+                            # Closed before the tag, try an earlier '['
+                            break
+
+            search_pos = tag_pos + 5
+
+    @staticmethod
+    def _parse_players_sync(html_content: str):
+        """
+        Extract player data from JSON embedded in the page.
+
+        CPU-bound; callers on the event loop should run it via
+        asyncio.to_thread.
+        """
+        search_pos = 0
+        found_any = False
+
+        while True:
+            json_str, search_pos = RoyaleAPIScraper._find_player_array(html_content, search_pos)
+            if json_str is None:
+                break
+            found_any = True
 
-        for i, match in enumerate(matches):
             try:
-                json_str = match
                 json_str = re.sub(r',\s*]', ']', json_str)
                 json_str = re.sub(r',\s*}', '}', json_str)
-                players = json.loads(json_str)
+                players = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
 
                 if isinstance(players, list) and len(players) > 0 and 'tag' in players[0]:
                     logging.info(f"Successfully parsed JSON array with {len(players)} players")
                     return players
-                    
-            except json.JSONDecodeError as e:
+
+            except ValueError as e:
                 logging.error(f"Could not parse JSON array: {e}")
                 continue
 
-        logging.error("No valid player JSON found in the page.")
+        if not found_any:
+            logging.error("Could not find any embedded player data.")
+        else:
+            logging.error("No valid player JSON found in the page.")
         return []
     
     @staticmethod
@@ -128,44 +246,47 @@ class RoyaleAPIScraper:
         """
         Find linked players in the top 8 positions
         """
-        top_8_players = players[:8]
         linked_players_found = []
-        
-        for player in top_8_players:
-            player_tag = player.get('tag', '').replace('#', '').upper()
-            player_name = player.get('name', 'Unknown')
-            rank = player.get('rank', player.get('position', 0))
-            
+
+        for player in players[:8]:
+            player_tag = player.get('tag')
             if not player_tag:
                 continue
-                
-            if player_tag in player_data:
-                logging.info(f"Found linked player at rank {rank}: {player_name} (#{player_tag})")
-                
-                linked_players_found.append({
-                    'tag': player_tag,
-                    'name': player_name,
-                    'rank': rank
-                })
-        
+
+            # Only the leading char can be '#', no need for a full replace scan
+            player_tag = player_tag[1:].upper() if player_tag[0] == '#' else player_tag.upper()
+
+            if player_data.get(player_tag) is None:
+                continue
+
+            player_name = player.get('name', 'Unknown')
+            rank = player.get('rank') or player.get('position', 0)
+            logging.info(f"Found linked player at rank {rank}: {player_name} (#{player_tag})")
+
+            linked_players_found.append({
+                'tag': player_tag,
+                'name': player_name,
+                'rank': rank
+            })
+
         return linked_players_found
 
 class PointManager:
-    POINT_SYSTEM = {
-        1: 20,  # Top 1
-        2: 14,  # Top 2
-        3: 12,  # Top 3
-        4: 10,  # Top 4
-        5: 8,   # Top 5
-        6: 6,   # Top 6
-        7: 4,   # Top 7
-        8: 2    # Top 8
-    }
-    
+    # Points awarded per leaderboard rank (Top 1 through Top 8); index 0 unused
+    _POINTS_BY_RANK = (0, 20, 14, 12, 10, 8, 6, 4, 2)
+
+    # Dict view kept for anything keyed by rank
+    POINT_SYSTEM = {rank: points for rank, points in enumerate(_POINTS_BY_RANK) if rank > 0}
+
+    # Constant input, so render the embed text once at import time
+    POINT_SYSTEM_TEXT = "\n".join(f"Top {rank}: {points} pts/hr" for rank, points in POINT_SYSTEM.items())
+
     @staticmethod
     def calculate_points(rank: int) -> int:
         """Calculate points based on rank"""
-        return PointManager.POINT_SYSTEM.get(rank, 0)
+        if 1 <= rank < len(PointManager._POINTS_BY_RANK):
+            return PointManager._POINTS_BY_RANK[rank]
+        return 0
     
     @staticmethod
     def calculate_order_percentages(player_points: Dict[str, int]) -> Dict[str, float]:
@@ -182,6 +303,13 @@ class PointManager:
         return percentages
 
 class Database:
+    DEBOUNCE_SECONDS = 2  # coalesce bursts of save requests
+    BACKUP_EVERY = 10  # rotate a backup every N saves instead of every save
+
+    _save_pending = asyncio.Event()
+    _save_task = None
+    _saves_since_backup = 0
+
     @staticmethod
     def get_data_path():
         """Get the data file path"""
@@ -197,32 +325,68 @@ class Database:
         return os.path.join(data_dir, 'player_data_backup.json')
     
     @staticmethod
-    def save_player_data():
-        """Save player data to file with backup"""
+    def request_save():
+        """Queue a save; the background writer coalesces rapid requests"""
+        Database._save_pending.set()
+
+    @staticmethod
+    def start_save_worker():
+        """Start the single background writer task (idempotent)"""
+        if Database._save_task is None or Database._save_task.done():
+            Database._save_task = asyncio.create_task(Database._save_worker())
+
+    @staticmethod
+    async def _save_worker():
+        """Wait for save requests, debounce, then write off the event loop"""
+        while True:
+            await Database._save_pending.wait()
+            await asyncio.sleep(Database.DEBOUNCE_SECONDS)
+            Database._save_pending.clear()
+            await asyncio.to_thread(Database._save_player_data_sync)
+
+    @staticmethod
+    async def load_player_data():
+        """Load player data without blocking the event loop"""
+        await asyncio.to_thread(Database._load_player_data_sync)
+
+    @staticmethod
+    def _save_player_data_sync():
+        """Save player data atomically via temp-file rename"""
         data = {
             'player_data': player_data,
-            'user_accounts': user_accounts
+            'user_accounts': user_accounts,
+            'bot_state': bot_state
         }
         try:
             data_path = Database.get_data_path()
-            backup_path = Database.get_backup_path()
-            
-            # Create backup first
-            if os.path.exists(data_path):
+            tmp_path = data_path + '.tmp'
+
+            with open(tmp_path, 'wb') as f:
+                # default=list serializes the tag sets; int keys become strings
+                if orjson is not None:
+                    f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=list))
+                else:
+                    f.write(json.dumps(data, default=list).encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Rotate a backup of the previous file every few saves
+            Database._saves_since_backup += 1
+            if Database._saves_since_backup >= Database.BACKUP_EVERY and os.path.exists(data_path):
                 import shutil
-                shutil.copy2(data_path, backup_path)
-            
-            with open(data_path, 'w') as f:
-                json.dump(data, f)
-            
+                shutil.copy2(data_path, Database.get_backup_path())
+                Database._saves_since_backup = 0
+
+            os.replace(tmp_path, data_path)
+
             logging.info("Player data saved successfully")
         except Exception as e:
             logging.error(f"Failed to save player data: {e}")
     
     @staticmethod
-    def load_player_data():
+    def _load_player_data_sync():
         """Load player data from file with backup fallback"""
-        global player_data, user_accounts
+        global player_data, user_accounts, bot_state
         
         try:
             data_path = Database.get_data_path()
@@ -230,56 +394,105 @@ class Database:
             
             # Try main file first
             if os.path.exists(data_path):
-                with open(data_path, 'r') as f:
-                    data = json.load(f)
-                    player_data = data.get('player_data', {})
-                    user_accounts = data.get('user_accounts', {})
+                with open(data_path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                player_data = data.get('player_data', {})
+                user_accounts = {uid: set(tags) for uid, tags in data.get('user_accounts', {}).items()}
+                bot_state = data.get('bot_state', {})
                 logging.info("Player data loaded successfully")
                 return
-            
+
             # Try backup file
             if os.path.exists(backup_path):
-                with open(backup_path, 'r') as f:
-                    data = json.load(f)
-                    player_data = data.get('player_data', {})
-                    user_accounts = data.get('user_accounts', {})
+                with open(backup_path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                player_data = data.get('player_data', {})
+                user_accounts = {uid: set(tags) for uid, tags in data.get('user_accounts', {}).items()}
+                bot_state = data.get('bot_state', {})
                 logging.warning("Loaded player data from backup")
                 return
                 
             # No data files found
             player_data = {}
             user_accounts = {}
+            bot_state = {}
             logging.info("No existing player data found, starting fresh")
             
         except Exception as e:
             logging.error(f"Failed to load player data: {e}")
             player_data = {}
             user_accounts = {}
+            bot_state = {}
 
 def update_user_accounts():
-    """Update user_accounts from player_data"""
-    global user_accounts
+    """Update user_accounts and user_totals from player_data"""
+    global user_accounts, user_totals
     user_accounts = {}
-    
+    user_totals = {}
+
     for player_tag, data in player_data.items():
         discord_id = data["discord_id"]
-        if discord_id not in user_accounts:
-            user_accounts[discord_id] = []
-        if player_tag not in user_accounts[discord_id]:
-            user_accounts[discord_id].append(player_tag)
+        user_accounts.setdefault(discord_id, set()).add(player_tag)
+        user_totals[discord_id] = user_totals.get(discord_id, 0) + data["points"]
+
+def add_chunked_fields(embed, name, text, inline=False):
+    """Add text to an embed, split across fields to respect the 1024-char value limit"""
+    chunks = []
+    current = []
+    current_len = 0
+
+    for line in text.splitlines(keepends=True):
+        if current and current_len + len(line) > 1024:
+            chunks.append("".join(current))
+            current = []
+            current_len = 0
+        current.append(line)
+        current_len += len(line)
+    if current:
+        chunks.append("".join(current))
+
+    for i, chunk in enumerate(chunks):
+        embed.add_field(
+            name=name if i == 0 else f"{name} (cont.)",
+            value=chunk[:1024],
+            inline=inline
+        )
+
+# Display-name cache so embed builders don't hit member fetches repeatedly
+_display_name_cache = {}  # Format: {user_id: (name, cached_at)}
+DISPLAY_NAME_TTL = 3600  # matches the hourly embed cadence
+
+async def get_display_name(guild, user_id):
+    """Resolve a member display name with a TTL cache, falling back to a mention"""
+    now = asyncio.get_event_loop().time()
+    cached = _display_name_cache.get(user_id)
+    if cached and now - cached[1] < DISPLAY_NAME_TTL:
+        return cached[0]
+
+    member = guild.get_member(user_id) if guild else None
+    if member is None and guild is not None:
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.HTTPException:
+            member = None
+
+    name = member.display_name if member else f"<@{user_id}>"
+    _display_name_cache[user_id] = (name, now)
+    return name
 
 def validate_player_tag(tag: str) -> bool:
     """Validate Clash Royale player tag format"""
-    import re
-    pattern = r'^[0289PYLQGRJCUV]{3,}$'
-    return bool(re.match(pattern, tag.upper()))
+    return _TAG_RE.match(tag.upper()) is not None
 
 @bot.event
 async def on_ready():
     logging.info(f'{bot.user} has connected to Discord!')
-    Database.load_player_data()
+    RoyaleAPIScraper.get_session()
+    await Database.load_player_data()
     update_user_accounts()
-    await update_leaderboard()
+    Database.start_save_worker()
     
     try:
         synced = await bot.tree.sync()
@@ -288,7 +501,6 @@ async def on_ready():
         logging.error(f"Error syncing slash commands: {e}")
     
     update_points.start()
-    update_leaderboard.start()
     daily_orders_calculation.start()
     health_check.start()
     
@@ -318,11 +530,10 @@ async def link_slash(interaction: discord.Interaction, player_tag: str, discord_
         "name": discord_user.display_name
     }
     
-    if discord_user.id not in user_accounts:
-        user_accounts[discord_user.id] = []
-    user_accounts[discord_user.id].append(player_tag)
-    
-    Database.save_player_data()
+    user_accounts.setdefault(discord_user.id, set()).add(player_tag)
+    user_totals.setdefault(discord_user.id, 0)
+
+    Database.request_save()
     
     embed = discord.Embed(
         title="✅ Account Linked Successfully",
@@ -345,14 +556,18 @@ async def unlink_slash(interaction: discord.Interaction, player_tag: str):
         return
     
     discord_id = player_data[player_tag]["discord_id"]
+    removed_points = player_data[player_tag]["points"]
     del player_data[player_tag]
-    
+
     if discord_id in user_accounts and player_tag in user_accounts[discord_id]:
         user_accounts[discord_id].remove(player_tag)
         if not user_accounts[discord_id]:
             del user_accounts[discord_id]
+            user_totals.pop(discord_id, None)
+        elif discord_id in user_totals:
+            user_totals[discord_id] -= removed_points
     
-    Database.save_player_data()
+    Database.request_save()
     await interaction.response.send_message(f"✅ Successfully unlinked player tag `#{player_tag}`.")
 
 @bot.tree.command(name="linked_accounts", description="View all linked accounts for a user (Admin only)")
@@ -371,7 +586,7 @@ async def linked_accounts_slash(interaction: discord.Interaction, discord_user:
     accounts_info = []
     total_points = 0
     
-    for tag in user_tags:
+    for tag in sorted(user_tags):
         points = player_data[tag]["points"]
         total_points += points
         accounts_info.append(f"`#{tag}`: {points} points")
@@ -407,15 +622,14 @@ async def all_linked_accounts_slash(interaction: discord.Interaction):
     )
     
     for user_id, tags in user_accounts.items():
-        user = bot.get_user(user_id)
-        if user:
-            total_points = sum(player_data[tag]["points"] for tag in tags)
-            account_count = len(tags)
-            embed.add_field(
-                name=user.display_name,
-                value=f"Accounts: {account_count} | Total Points: {total_points}",
-                inline=False
-            )
+        name = await get_display_name(interaction.guild, user_id)
+        total_points = user_totals.get(user_id, 0)
+        account_count = len(tags)
+        embed.add_field(
+            name=name,
+            value=f"Accounts: {account_count} | Total Points: {total_points}",
+            inline=False
+        )
     
     await interaction.response.send_message(embed=embed)
 
@@ -436,7 +650,7 @@ async def points_slash(interaction: discord.Interaction):
     total_points = 0
     accounts_info = []
     
-    for tag in user_tags:
+    for tag in sorted(user_tags):
         points = player_data[tag]["points"]
         total_points += points
         accounts_info.append(f"`#{tag}`: {points} points")
@@ -485,7 +699,10 @@ async def update_points_for_leaderboard():
             old_points = player_data[player_tag]["points"]
             player_data[player_tag]["points"] += points_to_add
             new_points = player_data[player_tag]["points"]
-            
+
+            discord_id = player_data[player_tag]["discord_id"]
+            user_totals[discord_id] = user_totals.get(discord_id, 0) + points_to_add
+
             logging.info(f"Added {points_to_add} points to {player_info['name']} (#{player_tag}) for rank {rank}")
             
             updates.append({
@@ -497,44 +714,45 @@ async def update_points_for_leaderboard():
             })
     
     if updates:
-        Database.save_player_data()
+        Database.request_save()
     
     return updates
 
 @tasks.loop(seconds=POINTS_UPDATE_INTERVAL)
 async def update_points():
-    """Update points every hour"""
-    channel = bot.get_channel(POINT_TRACKER_CHANNEL_ID)
-    if not channel:
-        return
-    
-    updates = await update_points_for_leaderboard()
-    
-    if updates:
-        embed = discord.Embed(
-            title="🔄 Points Updated",
-            description="Points have been updated based on current leaderboard positions",
-            color=discord.Color.gold(),
-            timestamp=datetime.datetime.utcnow()
-        )
-        
-        for update in updates:
-            embed.add_field(
-                name=f"#{update['rank']} - {update['name']}",
-                value=f"Added: {update['points_added']} points | Total: {update['total_points']}",
-                inline=False
+    """Update points and refresh the leaderboard every hour"""
+    try:
+        updates = await update_points_for_leaderboard()
+
+        # The channel check only gates the announcement, not the refresh below
+        channel = bot.get_channel(POINT_TRACKER_CHANNEL_ID)
+        if channel and updates:
+            embed = discord.Embed(
+                title="🔄 Points Updated",
+                description="Points have been updated based on current leaderboard positions",
+                color=discord.Color.gold(),
+                timestamp=datetime.datetime.utcnow()
             )
-        
-        await channel.send(embed=embed)
+
+            for update in updates:
+                embed.add_field(
+                    name=f"#{update['rank']} - {update['name']}",
+                    value=f"Added: {update['points_added']} points | Total: {update['total_points']}",
+                    inline=False
+                )
+
+            await channel.send(embed=embed)
+    except Exception as e:
+        logging.error(f"Points update failed: {e}")
+
+    # Same cadence as the points update, so render the leaderboard here
+    # instead of from a second scheduled task
+    await refresh_leaderboard()
 
 async def create_leaderboard_embed():
     """Create leaderboard embed"""
-    user_totals = {}
-    for user_id, tags in user_accounts.items():
-        total_points = sum(player_data[tag]["points"] for tag in tags)
-        user_totals[user_id] = total_points
-    
-    sorted_users = sorted(user_totals.items(), key=lambda x: x[1], reverse=True)
+    # Only the top 10 are displayed, so avoid a full sort
+    sorted_users = heapq.nlargest(10, user_totals.items(), key=lambda x: x[1])
     
     embed = discord.Embed(
         title="🏆 CRL 2025 Points Leaderboard",
@@ -551,54 +769,56 @@ async def create_leaderboard_embed():
         )
         return embed
     
-    leaderboard_text = ""
-    for i, (user_id, total_points) in enumerate(sorted_users[:10], 1):
-        user = bot.get_user(user_id)
-        if user:
-            account_count = len(user_accounts[user_id])
-            leaderboard_text += f"**{i}. {user.mention}**\n"
-            leaderboard_text += f"   Total Points: {total_points} | Accounts: {account_count}\n"
-            
-            if account_count <= 3:
-                account_details = []
-                for tag in user_accounts[user_id]:
-                    points = player_data[tag]["points"]
-                    account_details.append(f"`#{tag}`: {points}")
-                leaderboard_text += f"   Accounts: {', '.join(account_details)}\n"
-            
-            leaderboard_text += "\n"
-    
-    embed.add_field(name="Top Players", value=leaderboard_text, inline=False)
+    lines = []
+    for i, (user_id, total_points) in enumerate(sorted_users, 1):
+        # Mention strings render without needing the user in cache
+        account_count = len(user_accounts.get(user_id, []))
+        lines.append(f"**{i}. <@{user_id}>**\n")
+        lines.append(f"   Total Points: {total_points} | Accounts: {account_count}\n")
+
+        if 0 < account_count <= 3:
+            account_details = []
+            for tag in sorted(user_accounts[user_id]):
+                points = player_data[tag]["points"]
+                account_details.append(f"`#{tag}`: {points}")
+            lines.append(f"   Accounts: {', '.join(account_details)}\n")
+
+        lines.append("\n")
+
+    add_chunked_fields(embed, "Top Players", "".join(lines))
     
-    point_system_text = "\n".join([f"Top {rank}: {points} pts/hr" for rank, points in PointManager.POINT_SYSTEM.items()])
-    embed.add_field(name="Point System", value=point_system_text, inline=True)
+    embed.add_field(name="Point System", value=PointManager.POINT_SYSTEM_TEXT, inline=True)
     
     return embed
 
-@tasks.loop(seconds=LEADERBOARD_UPDATE_INTERVAL)
-async def update_leaderboard():
-    """Update leaderboard every hour"""
+async def refresh_leaderboard():
+    """Refresh the persistent leaderboard message"""
     channel = bot.get_channel(LEADERBOARD_CHANNEL_ID)
     if not channel:
         return
     
     update_user_accounts()
 
-    try:
-        await channel.purge(limit=10)
-    except:
-        pass
-    
     embed = await create_leaderboard_embed()
-    await channel.send(embed=embed)
+
+    # Edit the persistent leaderboard message instead of purging and resending
+    message_id = bot_state.get('leaderboard_message_id')
+    if message_id:
+        try:
+            message = await channel.fetch_message(message_id)
+            await message.edit(embed=embed)
+            return
+        except discord.NotFound:
+            pass  # message was deleted, send a fresh one
+        except discord.HTTPException as e:
+            logging.error(f"Failed to edit leaderboard message: {e}")
+
+    message = await channel.send(embed=embed)
+    bot_state['leaderboard_message_id'] = message.id
+    Database.request_save()
 
 async def calculate_daily_orders():
     """Calculate and send daily order percentages"""
-    user_totals = {}
-    for user_id, tags in user_accounts.items():
-        total_points = sum(player_data[tag]["points"] for tag in tags)
-        user_totals[user_id] = total_points
-    
     if not user_totals:
         return None
     
@@ -618,30 +838,28 @@ async def calculate_daily_orders():
         timestamp=datetime.datetime.utcnow()
     )
     
-    breakdown_text = ""
+    breakdown_lines = []
     total_orders_percentage = 0
-    
+
     for i, (user_id, percentage) in enumerate(sorted_percentages, 1):
-        user = bot.get_user(user_id)
-        if not user:
-            continue
-            
         actual_percentage = round(percentage * 0.7, 1)
         total_orders_percentage += actual_percentage
-        
-        account_count = len(user_accounts[user_id])
+
+        account_count = len(user_accounts.get(user_id, []))
         total_user_points = user_totals[user_id]
-        
-        breakdown_text += f"**{i}. {user.mention}**\n"
-        breakdown_text += f"   Total Points: {total_user_points}\n"
-        breakdown_text += f"   Linked Accounts: {account_count}\n"
-        breakdown_text += f"   Orders: {actual_percentage}%\n\n"
-    
-    embed.add_field(name="Order Distribution", value=breakdown_text, inline=False)
-    
-    summary_text = f"**Total Orders Allocated: {total_orders_percentage}%**\n"
-    summary_text += f"*Remaining {round(100 - total_orders_percentage, 1)}% allocated to other categories*"
-    
+
+        breakdown_lines.append(f"**{i}. <@{user_id}>**\n")
+        breakdown_lines.append(f"   Total Points: {total_user_points}\n")
+        breakdown_lines.append(f"   Linked Accounts: {account_count}\n")
+        breakdown_lines.append(f"   Orders: {actual_percentage}%\n\n")
+
+    add_chunked_fields(embed, "Order Distribution", "".join(breakdown_lines))
+
+    summary_text = (
+        f"**Total Orders Allocated: {total_orders_percentage}%**\n"
+        f"*Remaining {round(100 - total_orders_percentage, 1)}% allocated to other categories*"
+    )
+
     embed.add_field(name="Summary", value=summary_text, inline=False)
     
     return embed
@@ -654,11 +872,14 @@ async def daily_orders_calculation():
         return
     
     try:
-        # Clear previous daily order messages from the bot
-        async for message in channel.history(limit=50):
-            if message.author == bot.user and "Daily CRL 20 Win Challenge Orders Breakdown" in message.embeds[0].title if message.embeds else False:
-                await message.delete()
-                await asyncio.sleep(1)  # Rate limit protection
+        # Clear previous daily order messages from the bot in one bulk call
+        to_delete = [
+            message async for message in channel.history(limit=50)
+            if message.author == bot.user and message.embeds
+            and "Daily CRL 20 Win Challenge Orders Breakdown" in (message.embeds[0].title or "")
+        ]
+        if to_delete:
+            await channel.delete_messages(to_delete)
     except Exception as e:
         logging.error(f"Error clearing old order messages: {e}")
     
@@ -677,10 +898,6 @@ async def health_check():
             logging.error("Points update task stopped! Restarting...")
             update_points.start()
         
-        if not update_leaderboard.is_running():
-            logging.error("Leaderboard update task stopped! Restarting...")
-            update_leaderboard.start()
-            
         if not daily_orders_calculation.is_running():
             logging.error("Daily orders task stopped! Restarting...")
             daily_orders_calculation.start()
@@ -703,10 +920,14 @@ async def on_app_command_error(interaction: discord.Interaction, error):
         await interaction.response.send_message("❌ An error occurred while executing the command.", ephemeral=True)
 
 if __name__ == "__main__":
-    Database.load_player_data()
+    Database._load_player_data_sync()
     update_user_accounts()
     
     try:
         bot.run(BOT_TOKEN)
     except Exception as e:
-        logging.critical(f"Bot crashed: {e}")
\ No newline at end of file
+        logging.critical(f"Bot crashed: {e}")
+    finally:
+        # Flush any save the debounced writer didn't get to
+        if Database._save_pending.is_set():
+            Database._save_player_data_sync()
\ No newline at end of file